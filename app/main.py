@@ -1,87 +1,280 @@
+import array
 import asyncio
 import time
+from contextlib import asynccontextmanager, suppress
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from typing import Any
+from urllib.parse import urlsplit
 
 import httpx
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+VERSION = "1.1.0"
+CACHE_TTL = 30
+CHECK_TIMEOUT = 10.0
+# Longest an SSE subscriber can go without a full payload even if nothing
+# changed, so reconnecting or lossy clients re-sync.
+SSE_RESYNC_SECONDS = 60.0
+
+# Single pooled client shared by all health checks: keep-alive + HTTP/2 avoid
+# a fresh TCP/TLS handshake per probe and multiplex probes to the same origin.
+_http: httpx.AsyncClient | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _http
+    _http = httpx.AsyncClient(
+        http2=True,
+        # keepalive_expiry must outlive CACHE_TTL so each 30s refresh reuses
+        # the warm per-origin connections instead of re-handshaking.
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=120),
+        # Granular budgets: a stuck connect or exhausted pool fails fast
+        # instead of consuming the whole per-probe read allowance.
+        timeout=httpx.Timeout(connect=3.0, read=CHECK_TIMEOUT, write=5.0, pool=5.0),
+        follow_redirects=True,
+        # Client-level defaults: one header dict built at startup instead of
+        # per request. Probes identify themselves upstream, and Accept steers
+        # health endpoints toward their compact JSON form rather than HTML.
+        headers={"User-Agent": f"orcest-status/{VERSION}", "Accept": "application/json"},
+    )
+    # Warm the resolver before the first probe round; a slow or flapping
+    # DNS server then costs startup time, not first-request latency.
+    with suppress(asyncio.TimeoutError):
+        await asyncio.wait_for(_warm_dns(), timeout=5)
+    refresh_task = asyncio.create_task(_periodic_refresh())
+    yield
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+    await _http.aclose()
+    _http = None
+
+
+async def _warm_dns() -> None:
+    """Pre-resolve every service hostname (IP literals return immediately)."""
+    loop = asyncio.get_running_loop()
+    hosts = {urlsplit(svc.health).hostname for svc in SERVICES}
+    await asyncio.gather(
+        *(loop.getaddrinfo(host, None) for host in hosts if host),
+        return_exceptions=True,
+    )
+
+
+async def _periodic_refresh() -> None:
+    """Keep the status cache warm so requests never wait on health probes."""
+    while True:
+        try:
+            await check_all_services(force=True)
+        except Exception:
+            pass
+        await asyncio.sleep(_cache["ttl"])
+
+
 app = FastAPI(
     title="Orcest Status",
     description="Orcest AI Ecosystem Status & Monitoring Dashboard",
-    version="1.1.0",
+    version=VERSION,
     docs_url=None,
     redoc_url=None,
     openapi_url=None,
+    lifespan=lifespan,
+    # Endpoints that return plain dicts (health, announcements, topology)
+    # serialize through orjson instead of the stdlib encoder.
+    default_response_class=ORJSONResponse,
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=500)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-CACHE_TTL = 30
-CHECK_TIMEOUT = 10.0
+# Compile the dashboard template once at import; renders reuse the parsed nodes.
+_STATUS_TEMPLATE = templates.get_template("status.html")
+
+
+@dataclass(frozen=True, slots=True)
+class Service:
+    name: str
+    url: str
+    health: str
+    type: str
+    description: str
+    # HEAD skips the response body for probes that only care about the code;
+    # endpoints that reject it fall back to GET at probe time.
+    health_method: str = "GET"
+
+
+SERVICES: tuple[Service, ...] = (
+    Service(
+        name="Orcest AI",
+        url="https://orcest.ai",
+        health="https://orcest.ai/health",
+        type="web",
+        description="Landing page & API gateway",
+    ),
+    Service(
+        name="RainyModel",
+        url="https://rm.orcest.ai",
+        health="https://rm.orcest.ai/health",
+        type="api",
+        description="LLM routing proxy",
+    ),
+    Service(
+        name="Lamino",
+        url="https://orcest.ai/lamino",
+        health="https://orcest.ai/lamino/api/health",
+        type="web",
+        description="AI chat + SSO workspaces + decision chain",
+    ),
+    Service(
+        name="Maestrist",
+        url="https://agent.orcest.ai",
+        health="https://agent.orcest.ai/api/litellm-models",
+        type="web",
+        description="AI software development agent",
+    ),
+    Service(
+        name="Orcide",
+        url="https://ide.orcest.ai",
+        health="https://ide.orcest.ai",
+        type="web",
+        description="AI-powered code editor",
+        health_method="HEAD",
+    ),
+    Service(
+        name="Login SSO",
+        url="https://login.orcest.ai",
+        health="https://login.orcest.ai/health",
+        type="api",
+        description="Identity provider",
+    ),
+    Service(
+        name="Ollama Primary",
+        url="http://164.92.147.36:11434",
+        health="http://164.92.147.36:11434/api/tags",
+        type="internal",
+        description="16GB - qwen2.5:14b",
+    ),
+    Service(
+        name="Ollama Secondary",
+        url="http://178.128.196.3:11434",
+        health="http://178.128.196.3:11434/api/tags",
+        type="internal",
+        description="8GB - qwen2.5:7b fallback",
+    ),
+)
 
-SERVICES: list[dict[str, str]] = [
-    {
-        "name": "Orcest AI",
-        "url": "https://orcest.ai",
-        "health": "https://orcest.ai/health",
-        "type": "web",
-        "description": "Landing page & API gateway",
-    },
-    {
-        "name": "RainyModel",
-        "url": "https://rm.orcest.ai",
-        "health": "https://rm.orcest.ai/health",
-        "type": "api",
-        "description": "LLM routing proxy",
-    },
-    {
-        "name": "Lamino",
-        "url": "https://orcest.ai/lamino",
-        "health": "https://orcest.ai/lamino/api/health",
-        "type": "web",
-        "description": "AI chat + SSO workspaces + decision chain",
-    },
-    {
-        "name": "Maestrist",
-        "url": "https://agent.orcest.ai",
-        "health": "https://agent.orcest.ai/api/litellm-models",
-        "type": "web",
-        "description": "AI software development agent",
-    },
-    {
-        "name": "Orcide",
-        "url": "https://ide.orcest.ai",
-        "health": "https://ide.orcest.ai",
-        "type": "web",
-        "description": "AI-powered code editor",
-    },
-    {
-        "name": "Login SSO",
-        "url": "https://login.orcest.ai",
-        "health": "https://login.orcest.ai/health",
-        "type": "api",
-        "description": "Identity provider",
-    },
-    {
-        "name": "Ollama Primary",
-        "url": "http://164.92.147.36:11434",
-        "health": "http://164.92.147.36:11434/api/tags",
-        "type": "internal",
-        "description": "16GB - qwen2.5:14b",
-    },
-    {
-        "name": "Ollama Secondary",
-        "url": "http://178.128.196.3:11434",
-        "health": "http://178.128.196.3:11434/api/tags",
-        "type": "internal",
-        "description": "8GB - qwen2.5:7b fallback",
-    },
-]
+# Static half of every probe result, derived once at import so the probe
+# path never re-serializes the unchanging Service fields.
+_SERVICE_BASE: dict[str, dict[str, str]] = {svc.name: asdict(svc) for svc in SERVICES}
+
+# Uptime counters since process start, as parallel unsigned arrays indexed by
+# service ordinal: cheap single-slot increments, no per-check dict churn.
+_SVC_INDEX: dict[str, int] = {svc.name: i for i, svc in enumerate(SERVICES)}
+_uptime_checks = array.array("Q", [0] * len(SERVICES))
+_uptime_ok = array.array("Q", [0] * len(SERVICES))
+
+# Per-service probe-method overrides learned at runtime (HEAD -> GET on 405).
+_probe_method: dict[str, str] = {}
+
+# Bounds simultaneous outbound probes so a growing service list cannot burst
+# the resolver or ephemeral-port pool in a single gather.
+_probe_sem = asyncio.Semaphore(16)
+
+HISTORY_SIZE = 120
+
+_STATUS_CODES = {"operational": 0, "degraded": 1, "down": 2, "timeout": 3}
+_STATUS_NAMES = ("operational", "degraded", "down", "timeout")
+
+
+class _History:
+    """Per-service sample window as parallel typed ring buffers (SoA).
+
+    One array per field instead of a deque of dicts: a full window is a few
+    KB of contiguous scalars, appends are four slot writes, and dicts are
+    only materialized for the slice a caller actually requests.
+    """
+
+    __slots__ = ("latency", "code", "status", "ts", "idx", "filled", "error_count", "transition_count", "last_status", "latency_sum")
+
+    def __init__(self) -> None:
+        self.latency = array.array("l", [0] * HISTORY_SIZE)
+        self.code = array.array("h", [0] * HISTORY_SIZE)
+        self.status = array.array("B", [0] * HISTORY_SIZE)
+        self.ts = array.array("d", [0.0] * HISTORY_SIZE)
+        self.idx = 0
+        self.filled = 0
+        # Window aggregates kept incrementally on append (with roll-off
+        # correction) so reads never rescan the buffers.
+        self.error_count = 0
+        self.transition_count = 0
+        self.last_status = -1
+        self.latency_sum = 0
+
+    def append(self, status: str, code: int, latency_ms: int, ts: float) -> None:
+        i = self.idx
+        if self.filled == HISTORY_SIZE:
+            self.latency_sum -= self.latency[i]
+            if self._is_error(self.status[i], self.code[i]):
+                self.error_count -= 1
+            # The oldest sample leaves the window: if it differed from its
+            # successor, that transition leaves with it.
+            if self.status[i] != self.status[(i + 1) % HISTORY_SIZE]:
+                self.transition_count -= 1
+        self.latency_sum += latency_ms
+        status_code = _STATUS_CODES.get(status, 2)
+        if self._is_error(status_code, code):
+            self.error_count += 1
+        if self.last_status not in (-1, status_code):
+            self.transition_count += 1
+        self.last_status = status_code
+        self.status[i] = status_code
+        self.code[i] = code
+        self.latency[i] = latency_ms
+        self.ts[i] = ts
+        self.idx = (i + 1) % HISTORY_SIZE
+        if self.filled < HISTORY_SIZE:
+            self.filled += 1
+
+    @staticmethod
+    def _is_error(status_code: int, http_code: int) -> bool:
+        return status_code != 0 or http_code >= 400
+
+    def latency_percentiles(self) -> dict[str, int]:
+        n = self.filled
+        if n == 0:
+            return {"avg": 0, "p50": 0, "p95": 0, "p99": 0}
+        # The average reads the running sum; one sort serves every requested
+        # percentile (nearest-rank) over at most HISTORY_SIZE small ints.
+        ordered = sorted(self.latency if n == HISTORY_SIZE else self.latency[:n])
+        return {
+            "avg": self.latency_sum // n,
+            "p50": ordered[min(n - 1, n * 50 // 100)],
+            "p95": ordered[min(n - 1, n * 95 // 100)],
+            "p99": ordered[min(n - 1, n * 99 // 100)],
+        }
+
+    def recent(self, limit: int) -> list[dict[str, Any]]:
+        n = min(limit, self.filled)
+        first = (self.idx - n) % HISTORY_SIZE
+        return [
+            {
+                "status": _STATUS_NAMES[self.status[i]],
+                "code": self.code[i],
+                "latency_ms": self.latency[i],
+                "ts": self.ts[i],
+            }
+            for i in ((first + k) % HISTORY_SIZE for k in range(n))
+        ]
+
+
+_history: tuple[_History, ...] = tuple(_History() for _ in SERVICES)
 
 TOPOLOGY_VIEWS: dict[str, dict[str, Any]] = {
     "overview": {
@@ -283,6 +476,26 @@ flowchart TB
     },
 }
 
+# TOPOLOGY_VIEWS never changes at runtime, so the navigation and index
+# listings derived from it are built once at import instead of per request.
+_TOPOLOGY_NAV = [{"key": key, "title": value["title"]} for key, value in TOPOLOGY_VIEWS.items()]
+_TOPOLOGY_INDEX = [
+    {"key": key, "title": value["title"], "subtitle": value["subtitle"]}
+    for key, value in TOPOLOGY_VIEWS.items()
+]
+
+# The flowchart pages are pure functions of TOPOLOGY_VIEWS, so each one is
+# rendered to bytes once at import; the /fc handlers are dict lookups.
+_FC_TEMPLATE = templates.get_template("fc.html")
+_FC_PAGES: dict[str, bytes] = {
+    key: _FC_TEMPLATE.render(
+        current_view=key,
+        view_data=view,
+        views=_TOPOLOGY_NAV,
+    ).encode("utf-8")
+    for key, view in TOPOLOGY_VIEWS.items()
+}
+
 ANNOUNCEMENTS = [
     {
         "date": "2026-02-21",
@@ -298,58 +511,176 @@ ANNOUNCEMENTS = [
     },
 ]
 
-_cache: dict[str, Any] = {"data": None, "ts": 0.0}
+# ANNOUNCEMENTS is immutable at runtime; serialize its response body once.
+_ANNOUNCEMENTS_JSON = orjson.dumps({"announcements": ANNOUNCEMENTS})
+
+# Same for the health body: constant for the process lifetime.
+_HEALTH_JSON = orjson.dumps({"status": "healthy", "version": VERSION})
+
+_cache: dict[str, Any] = {"data": None, "ts": 0.0, "ttl": float(CACHE_TTL), "stale": False}
+# Pre-encoded forms of the current snapshot, keyed on its checked_at stamp.
+_html_cache: dict[str, Any] = {"key": None, "body": b""}
+_json_cache: dict[str, Any] = {"key": None, "body": b""}
+
+# SSE fan-out: each connected client owns a small queue fed by the single
+# background refresher, so probe load stays O(1) in the number of clients.
+_sse_subscribers: set[asyncio.Queue] = set()
+# Last broadcast state: per-service (status, code) fingerprint plus when the
+# last full payload went out, so steady-state refreshes skip the wire.
+_sse_last: dict[str, Any] = {"digest": None, "sent": 0.0}
+_refresh_lock = asyncio.Lock()
+# Keeps a reference to the in-flight stale-while-revalidate task so the event
+# loop cannot garbage-collect it mid-refresh.
+_revalidate_task: asyncio.Task | None = None
+
+
+async def _revalidate() -> None:
+    """Refresh the snapshot off the request path once the TTL has lapsed."""
+    async with _refresh_lock:
+        if time.monotonic() - _cache["ts"] < _cache["ttl"]:
+            return
+        try:
+            await _refresh_status()
+        except Exception:
+            # Same fail-open policy as the foreground path: keep serving the
+            # last good snapshot, flagged stale, and retry next window.
+            _cache["ts"] = time.monotonic()
+            _cache["stale"] = True
+
+
+def _utcnow_iso() -> str:
+    # time.strftime over gmtime is markedly cheaper than constructing an
+    # aware datetime and calling isoformat; second resolution is plenty here.
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime())
+
+
+# Topology data only changes with a deploy, so the response bodies are fixed
+# per process: serialize them once here (updated_at = process start) and serve
+# raw bytes; only the 404 path is built per request.
+_TOPOLOGY_UPDATED_AT = _utcnow_iso()
+_TOPOLOGY_INDEX_BYTES = orjson.dumps(
+    {
+        "views": _TOPOLOGY_INDEX,
+        "updated_at": _TOPOLOGY_UPDATED_AT,
+        "diagram_url": "https://status.orcest.ai/fc",
+    }
+)
+_TOPOLOGY_VIEW_BYTES: dict[str, bytes] = {
+    key: orjson.dumps(
+        {
+            "view_key": key,
+            "title": view["title"],
+            "subtitle": view["subtitle"],
+            "node_links": view["node_links"],
+            "service_map": view.get("service_map", {}),
+            "updated_at": _TOPOLOGY_UPDATED_AT,
+        }
+    )
+    for key, view in TOPOLOGY_VIEWS.items()
+}
 
 
-async def check_service(service: dict[str, str], client: httpx.AsyncClient) -> dict[str, Any]:
-    started = time.perf_counter()
+async def check_service(service: Service, client: httpx.AsyncClient) -> dict[str, Any]:
+    async with _probe_sem:
+        return await _probe_service(service, client)
+
+
+async def _probe_service(service: Service, client: httpx.AsyncClient) -> dict[str, Any]:
+    start_ns = time.monotonic_ns()
+    code = 0
     try:
-        resp = await client.get(service["health"])
-        latency_ms = int((time.perf_counter() - started) * 1000)
-        if resp.status_code < 400:
-            status = "operational"
-        else:
-            status = "degraded"
-        return {
-            **service,
-            "status": status,
-            "code": resp.status_code,
-            "latency_ms": latency_ms,
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-        }
+        method = _probe_method.get(service.name, service.health_method)
+        resp = await client.request(method, service.health)
+        if resp.status_code == 405 and method == "HEAD":
+            _probe_method[service.name] = "GET"
+            resp = await client.get(service.health)
+        code = resp.status_code
+        status = "operational" if code < 400 else "degraded"
     except httpx.TimeoutException:
-        latency_ms = int((time.perf_counter() - started) * 1000)
-        return {
-            **service,
-            "status": "timeout",
-            "code": 0,
-            "latency_ms": latency_ms,
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-        }
+        status = "timeout"
     except Exception:
-        latency_ms = int((time.perf_counter() - started) * 1000)
-        return {
-            **service,
-            "status": "down",
-            "code": 0,
-            "latency_ms": latency_ms,
-            "checked_at": datetime.now(timezone.utc).isoformat(),
-        }
+        status = "down"
+    return {
+        **_SERVICE_BASE[service.name],
+        "status": status,
+        "code": code,
+        "latency_ms": (time.monotonic_ns() - start_ns) // 1_000_000,
+    }
 
 
 async def check_all_services(force: bool = False) -> dict[str, Any]:
-    now = time.time()
-    if not force and _cache["data"] and (now - _cache["ts"] < CACHE_TTL):
+    global _revalidate_task
+    # Stale-while-revalidate: once a snapshot exists, plain callers are never
+    # blocked on probes — a stale cache answers immediately and a background
+    # task refreshes it. TTL math runs on the monotonic clock so an NTP step
+    # can never make the cache look prematurely stale (or fresh forever).
+    if not force and _cache["data"]:
+        if time.monotonic() - _cache["ts"] >= _cache["ttl"] and not _refresh_lock.locked():
+            _revalidate_task = asyncio.create_task(_revalidate())
         return _cache["data"]
-
-    async with httpx.AsyncClient(timeout=CHECK_TIMEOUT, follow_redirects=True) as client:
-        results = await asyncio.gather(*(check_service(svc, client) for svc in SERVICES))
+    # Single-flight: concurrent callers arriving before the first snapshot
+    # wait here while one coroutine runs the fan-out, then reuse its result.
+    async with _refresh_lock:
+        if not force and _cache["data"]:
+            return _cache["data"]
+        try:
+            return await _refresh_status()
+        except Exception:
+            # Fail open: a broken refresh should degrade to the last good
+            # snapshot instead of taking the dashboard down with it. Bumping
+            # ts rate-limits retries against the dead upstreams to one per
+            # TTL window; the snapshot is flagged stale in the meantime.
+            if _cache["data"]:
+                _cache["ts"] = time.monotonic()
+                _cache["stale"] = True
+                return _cache["data"]
+            raise
+
+
+async def _refresh_status() -> dict[str, Any]:
+    # Wall-clock timestamp for history samples; the cache TTL below uses the
+    # monotonic clock instead.
+    now = time.time()
+    refresh_start = time.monotonic()
+    # Bound each probe individually so one hung DNS/TLS handshake cannot
+    # stall the whole fan-out past the health-check timeout.
+    raw = await asyncio.gather(
+        *(asyncio.wait_for(check_service(svc, _http), timeout=CHECK_TIMEOUT + 1) for svc in SERVICES),
+        return_exceptions=True,
+    )
+    # One timestamp per refresh: the snapshot is immutable for the TTL
+    # window, so stamping each result individually buys nothing.
+    checked_at = datetime.now(timezone.utc).isoformat()
+    # Single pass: summary counters accumulate alongside the per-service
+    # bookkeeping instead of re-scanning the result list per bucket.
+    results = []
+    operational = degraded = down = latency_total = 0
+    for i, (svc, res) in enumerate(zip(SERVICES, raw)):
+        if isinstance(res, BaseException):
+            status = "timeout" if isinstance(res, asyncio.TimeoutError) else "down"
+            res = {
+                **_SERVICE_BASE[svc.name],
+                "status": status,
+                "code": 0,
+                "latency_ms": int(CHECK_TIMEOUT * 1000),
+            }
+        status = res["status"]
+        if status == "operational":
+            operational += 1
+        elif status == "degraded":
+            degraded += 1
+        else:
+            down += 1
+        latency_total += res["latency_ms"]
+        _uptime_checks[i] += 1
+        _uptime_ok[i] += status == "operational"
+        _history[i].append(status, res["code"], res["latency_ms"], now)
+        res["uptime_pct"] = round(100.0 * _uptime_ok[i] / _uptime_checks[i], 2)
+        res["checked_at"] = checked_at
+        results.append(res)
 
     total = len(results)
-    operational = sum(1 for r in results if r["status"] == "operational")
-    degraded = sum(1 for r in results if r["status"] == "degraded")
-    down = sum(1 for r in results if r["status"] in {"down", "timeout"})
-    avg_latency = int(sum(r["latency_ms"] for r in results) / total) if total else 0
+    avg_latency = latency_total // total if total else 0
     overall = "operational" if down == 0 and degraded == 0 else ("degraded" if down == 0 else "partial_outage")
 
     payload = {
@@ -362,93 +693,152 @@ async def check_all_services(force: bool = False) -> dict[str, Any]:
             "avg_latency_ms": avg_latency,
         },
         "services": results,
-        "checked_at": datetime.now(timezone.utc).isoformat(),
+        "checked_at": checked_at,
         "cache_ttl_seconds": CACHE_TTL,
     }
     _cache["data"] = payload
-    _cache["ts"] = now
+    _cache["ts"] = time.monotonic()
+    # Adaptive freshness: when probes are slow the snapshot stays valid
+    # proportionally longer, so a struggling upstream is not re-probed at
+    # the same cadence as a healthy one.
+    _cache["ttl"] = min(max(float(CACHE_TTL), 2.0 * (_cache["ts"] - refresh_start)), 120.0)
+    _cache["stale"] = False
+    # Serialize once per refresh; /api/status responses and the SSE
+    # broadcast both reuse these bytes instead of re-encoding the payload.
+    data = orjson.dumps(payload)
+    _json_cache["body"] = data
+    _json_cache["key"] = checked_at
+    # Broadcast only when a service changed status or HTTP code; during a
+    # steady state subscribers get keepalive comments from the stream
+    # handler instead of identical multi-KB payloads. A full payload still
+    # goes out at least every SSE_RESYNC_SECONDS.
+    digest = tuple((r["status"], r["code"]) for r in results)
+    if digest != _sse_last["digest"] or _cache["ts"] - _sse_last["sent"] >= SSE_RESYNC_SECONDS:
+        _sse_last["digest"] = digest
+        _sse_last["sent"] = _cache["ts"]
+        for queue in _sse_subscribers:
+            with suppress(asyncio.QueueFull):
+                queue.put_nowait(data)
     return payload
 
 
+def _snapshot_etag(status_data: dict[str, Any]) -> str:
+    return f'W/"{status_data["checked_at"]}"'
+
+
 @app.get("/", response_class=HTMLResponse)
 async def status_dashboard(request: Request):
     status_data = await check_all_services()
-    return templates.TemplateResponse(
-        "status.html",
-        {
-            "request": request,
-            "status_data": status_data,
-            "announcements": ANNOUNCEMENTS,
-        },
+    etag = _snapshot_etag(status_data)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # The page only changes when the snapshot does, so render and encode it
+    # once per cache window; every other GET serves the prepared bytes.
+    key = status_data["checked_at"]
+    if _html_cache["key"] != key:
+        _html_cache["body"] = _STATUS_TEMPLATE.render(
+            {
+                "request": request,
+                "status_data": status_data,
+                "announcements": ANNOUNCEMENTS,
+            }
+        ).encode("utf-8")
+        _html_cache["key"] = key
+    return HTMLResponse(
+        _html_cache["body"],
+        headers={"ETag": etag, "Cache-Control": f"private, max-age={CACHE_TTL}"},
     )
 
 
 @app.get("/fc", response_class=HTMLResponse)
-async def flowchart_page(request: Request):
-    return templates.TemplateResponse(
-        "fc.html",
-        {
-            "request": request,
-            "current_view": "overview",
-            "view_data": TOPOLOGY_VIEWS["overview"],
-            "views": [{"key": key, "title": value["title"]} for key, value in TOPOLOGY_VIEWS.items()],
-        },
-    )
+async def flowchart_page():
+    return HTMLResponse(_FC_PAGES["overview"])
 
 
 @app.get("/fc/{view_key}", response_class=HTMLResponse)
-async def flowchart_view_page(request: Request, view_key: str):
-    view = TOPOLOGY_VIEWS.get(view_key)
-    if view is None:
-        return templates.TemplateResponse(
-            "fc.html",
-            {
-                "request": request,
-                "current_view": "overview",
-                "view_data": TOPOLOGY_VIEWS["overview"],
-                "views": [{"key": key, "title": value["title"]} for key, value in TOPOLOGY_VIEWS.items()],
-                "error_message": f"Unknown topology '{view_key}', showing overview.",
-            },
+async def flowchart_view_page(view_key: str):
+    page = _FC_PAGES.get(view_key)
+    if page is None:
+        # Unknown keys are rare enough to render on demand; everything else
+        # serves the pre-built bytes.
+        return HTMLResponse(
+            _FC_TEMPLATE.render(
+                current_view="overview",
+                view_data=TOPOLOGY_VIEWS["overview"],
+                views=_TOPOLOGY_NAV,
+                error_message=f"Unknown topology '{view_key}', showing overview.",
+            )
         )
-    return templates.TemplateResponse(
-        "fc.html",
-        {
-            "request": request,
-            "current_view": view_key,
-            "view_data": view,
-            "views": [{"key": key, "title": value["title"]} for key, value in TOPOLOGY_VIEWS.items()],
-        },
-    )
+    return HTMLResponse(page)
 
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "version": "1.1.0"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 @app.get("/api/status")
-async def api_status(force: bool = False):
-    return JSONResponse(await check_all_services(force=force))
+async def api_status(request: Request, force: bool = False):
+    status_data = await check_all_services(force=force)
+    etag = _snapshot_etag(status_data)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    # Serialize the snapshot once per cache window with orjson and hand the
+    # same bytes to every caller instead of re-encoding per request.
+    key = status_data["checked_at"]
+    if _json_cache["key"] != key:
+        _json_cache["body"] = orjson.dumps(status_data)
+        _json_cache["key"] = key
+    return Response(
+        _json_cache["body"],
+        media_type="application/json",
+        headers={
+            "ETag": etag,
+            "Cache-Control": f"private, max-age={CACHE_TTL}",
+            "X-Cache-Status": "stale" if _cache["stale"] else "fresh",
+        },
+    )
+
+
+@app.get("/api/status/history")
+async def api_status_history(limit: int = 60):
+    limit = max(1, min(limit, HISTORY_SIZE))
+    return {
+        "services": {
+            svc.name: {
+                "samples": _history[i].recent(limit),
+                "summary": {
+                    "window": _history[i].filled,
+                    "error_count": _history[i].error_count,
+                    "transitions": _history[i].transition_count,
+                    "latency_ms": _history[i].latency_percentiles(),
+                },
+            }
+            for i, svc in enumerate(SERVICES)
+        },
+        "window_size": HISTORY_SIZE,
+        "interval_seconds": CACHE_TTL,
+    }
 
 
 @app.get("/api/announcements")
 async def api_announcements():
-    return {"announcements": ANNOUNCEMENTS}
+    return Response(
+        _ANNOUNCEMENTS_JSON,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=60"},
+    )
 
 
 @app.get("/api/topology")
 async def api_topology():
-    return {
-        "views": [{"key": key, "title": value["title"], "subtitle": value["subtitle"]} for key, value in TOPOLOGY_VIEWS.items()],
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-        "diagram_url": "https://status.orcest.ai/fc",
-    }
+    return Response(_TOPOLOGY_INDEX_BYTES, media_type="application/json")
 
 
 @app.get("/api/topology/{view_key}")
 async def api_topology_view(view_key: str):
-    view = TOPOLOGY_VIEWS.get(view_key)
-    if view is None:
+    body = _TOPOLOGY_VIEW_BYTES.get(view_key)
+    if body is None:
         return JSONResponse(
             status_code=404,
             content={
@@ -457,23 +847,33 @@ async def api_topology_view(view_key: str):
                 "available_views": list(TOPOLOGY_VIEWS.keys()),
             },
         )
-    return {
-        "view_key": view_key,
-        "title": view["title"],
-        "subtitle": view["subtitle"],
-        "node_links": view["node_links"],
-        "service_map": view.get("service_map", {}),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-    }
+    return Response(body, media_type="application/json")
 
 
 @app.get("/api/status/stream")
 async def api_status_stream():
+    queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+
     async def event_generator():
-        while True:
-            payload = await check_all_services(force=True)
-            yield f"data: {JSONResponse(content=payload).body.decode('utf-8')}\n\n"
-            await asyncio.sleep(8)
+        _sse_subscribers.add(queue)
+        try:
+            # Immediate snapshot on connect, then push-based updates as the
+            # background refresher publishes them; no per-client probing.
+            payload = await check_all_services()
+            if _json_cache["key"] == payload["checked_at"]:
+                first = _json_cache["body"]
+            else:
+                first = orjson.dumps(payload)
+            yield b"data: " + first + b"\n\n"
+            while True:
+                try:
+                    data = await asyncio.wait_for(queue.get(), timeout=CACHE_TTL * 2)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield b"data: " + data + b"\n\n"
+        finally:
+            _sse_subscribers.discard(queue)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 